@@ -19,23 +19,67 @@ import numpy as np
 try:
   # Import TFLite interpreter from tflite_runtime package if it's available.
   from tflite_runtime.interpreter import Interpreter
+  from tflite_runtime.interpreter import load_delegate
 except ImportError:
   # If not, fallback to use the TFLite interpreter from the full TF package.
   import tensorflow as tf
   Interpreter = tf.lite.Interpreter
+  load_delegate = tf.lite.experimental.load_delegate
 # pylint: enable=g-import-not-at-top
 
+# Shared library of the XNNPACK delegate, which accelerates float inference on
+# ARM CPUs such as the Raspberry Pi. It isn't part of the tflite-runtime
+# package, so it's only used if it has been installed separately. See README.md.
+_XNNPACK_DELEGATE = 'libxnnpack_delegate.so'
+
+
+def _quantize(values, dtype, quantization):
+  """Converts float values to a quantized integer tensor.
+
+  Args:
+    values: A float32 numpy array.
+    dtype: The integer type of the quantized tensor, e.g. np.int8 or np.uint8.
+    quantization: The (scale, zero_point) tuple of the quantized tensor.
+
+  Returns:
+    A numpy array of type dtype.
+  """
+  scale, zero_point = quantization
+  dtype_info = np.iinfo(dtype)
+  quantized = np.round(values / scale + zero_point)
+  return np.clip(quantized, dtype_info.min, dtype_info.max).astype(dtype)
+
+
+def _dequantize(values, quantization):
+  """Converts a quantized integer tensor back to float values.
+
+  Args:
+    values: A quantized integer numpy array.
+    quantization: The (scale, zero_point) tuple of the quantized tensor.
+
+  Returns:
+    A float32 numpy array.
+  """
+  scale, zero_point = quantization
+  return (values.astype(np.float32) - zero_point) * scale
+
 
 class Classifier(object):
   """A wrapper class for a TFLite pose classification model."""
 
-  def __init__(self, model_name, label_file, score_threshold=0.1):
+  def __init__(self,
+               model_name,
+               label_file,
+               score_threshold=0.1,
+               num_threads=2):
     """Initialize a pose classification model.
 
     Args:
       model_name: Name of the TFLite pose classification model.
       label_file: Path of the label list file.
       score_threshold: The minimum keypoint score to run classification.
+      num_threads: Number of CPU threads used to run the model. On a Raspberry
+        Pi, using all 4 cores is often slower than 2 due to thread contention.
     """
 
     # Append TFLITE extension to model_name if there's no extension
@@ -43,17 +87,51 @@ class Classifier(object):
     if not ext:
       model_name += '.tflite'
 
-    # Initialize model
-    interpreter = Interpreter(model_path=model_name, num_threads=4)
+    # Initialize model with the XNNPACK delegate, and fallback to the default
+    # CPU kernels if the delegate isn't available on this device. The thread
+    # count of an external delegate has to be set through its own options.
+    try:
+      xnnpack_delegate = load_delegate(
+          _XNNPACK_DELEGATE, options={'num_threads': num_threads})
+      interpreter = Interpreter(
+          model_path=model_name,
+          num_threads=num_threads,
+          experimental_delegates=[xnnpack_delegate])
+    except ValueError:
+      interpreter = Interpreter(model_path=model_name, num_threads=num_threads)
     interpreter.allocate_tensors()
 
-    self._input_index = interpreter.get_input_details()[0]['index']
-    self._output_index = interpreter.get_output_details()[0]['index']
+    input_details = interpreter.get_input_details()[0]
+    output_details = interpreter.get_output_details()[0]
+    self._input_index = input_details['index']
+    self._output_index = output_details['index']
+
+    # Functions returning zero-copy numpy views of the input and output
+    # buffers. The views themselves must not be kept, as the interpreter
+    # refuses to run while references to its internal buffers are alive.
+    self._input_tensor = interpreter.tensor(self._input_index)
+    self._output_tensor = interpreter.tensor(self._output_index)
+    self._invoke = interpreter.invoke
+
+    # Quantized models take and return integer tensors, which need to be
+    # converted using the (scale, zero_point) parameters of the tensor.
+    self._input_dtype = input_details['dtype']
+    self._input_quantization = input_details['quantization']
+    self._output_dtype = output_details['dtype']
+    self._output_quantization = output_details['quantization']
+
     self._interpreter = interpreter
 
     self.pose_class_names = self._load_labels(label_file)
     self.score_threshold = score_threshold
 
+    # Result returned when the keypoints aren't confident enough to run
+    # classification, which is prepared once as it's the same for every frame.
+    # It's a tuple, like all results of classify_pose, so that callers can't
+    # modify the shared result.
+    self._zero_result = tuple(
+        (class_name, 0.0) for class_name in self.pose_class_names)
+
   def _load_labels(self, label_path):
     """Load label list from file.
 
@@ -61,10 +139,10 @@ class Classifier(object):
       label_path: Full path of label file.
 
     Returns:
-      An array contains the list of labels.
+      A tuple contains the list of labels.
     """
     with open(label_path, 'r') as f:
-      return [line.strip() for _, line in enumerate(f.readlines())]
+      return tuple(line.strip() for line in f)
 
   def classify_pose(self, keypoints_and_scores):
     """Run classification on an input.
@@ -75,34 +153,38 @@ class Classifier(object):
         and Movenet#detect() here.
 
     Returns:
-      A list of prediction result in the (class_name, probability) format.
+      A tuple of prediction result in the (class_name, probability) format.
       Sorted by probability descendingly.
     """
     # Check if keypoints are all detected before running the classifier.
     # If there's a keypoint below the threshold, return zero probability for all
     # class.
-    min_score = np.amin(keypoints_and_scores[:, 2])
-    if min_score < self.score_threshold:
-      return [(class_name, 0) for class_name in self.pose_class_names]
-
-    # Flatten the input and add an extra dimension to match with the requirement
-    # of the TFLite model.
-    input_tensor = keypoints_and_scores.flatten().astype(np.float32)
-    input_tensor = np.expand_dims(input_tensor, axis=0)
-
-    # Set the input and run inference
-    self._interpreter.set_tensor(self._input_index, input_tensor)
-    self._interpreter.invoke()
-
-    # Extract the output and squeeze the batch dimension
-    output = self._interpreter.get_tensor(self._output_index)
-    output = np.squeeze(output, axis=0)
+    if (keypoints_and_scores[:, 2] < self.score_threshold).any():
+      return self._zero_result
+
+    # Flatten the input to match with the requirement of the TFLite model.
+    # reshape() returns a view, and the assignment below casts the values
+    # while copying them into the interpreter's buffer, so no intermediate
+    # array is allocated for float models.
+    input_tensor = keypoints_and_scores.reshape(-1)
+    if np.issubdtype(self._input_dtype, np.integer):
+      input_tensor = _quantize(input_tensor, self._input_dtype,
+                               self._input_quantization)
+
+    # Write the input directly into the interpreter's buffer and run inference
+    self._input_tensor()[0] = input_tensor
+    self._invoke()
+
+    # Read the output directly from the interpreter's buffer, without the batch
+    # dimension
+    output = self._output_tensor()[0]
+    if np.issubdtype(self._output_dtype, np.integer):
+      output = _dequantize(output, self._output_quantization)
 
     # Sort output by probability descendingly
-    prob_descending = sorted(
-        range(len(output)), key=lambda k: output[k], reverse=True)
-    prob_list = [
-        (self.pose_class_names[idx], output[idx]) for idx in prob_descending
-    ]
+    prob_descending = np.argsort(-output, kind='stable')
+    prob_list = tuple(
+        zip([self.pose_class_names[idx] for idx in prob_descending],
+            output[prob_descending].tolist()))
 
     return prob_list
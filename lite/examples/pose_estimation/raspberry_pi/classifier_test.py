@@ -15,9 +15,12 @@
 
 import unittest
 
+from classifier import _dequantize
+from classifier import _quantize
 from classifier import Classifier
 import cv2
 from movenet import Movenet
+import numpy as np
 
 _ESTIMATION_MODEL = 'movenet_lightning'
 _CLASSIFIER_MODEL = 'classifier'
@@ -41,6 +44,22 @@ class ClassifierTest(unittest.TestCase):
     self.assertEqual(class_name, 'tree',
                      'Predicted pose is different from ground truth.')
 
+  def test_quantize_round_trip(self):
+    """Test if int8 quantization of the model input and output is reversible."""
+    quantization = (1 / 127, 0)
+    values = np.linspace(-1, 1, 51, dtype=np.float32)
+    quantized = _quantize(values, np.int8, quantization)
+    self.assertEqual(quantized.dtype, np.int8)
+    np.testing.assert_allclose(
+        _dequantize(quantized, quantization), values, atol=0.5 / 127)
+
+  def test_quantize_clips_to_dtype_range(self):
+    """Test if values outside of the quantized range are clipped."""
+    quantization = (1 / 127, 0)
+    values = np.array([-2, -1, 1, 2], dtype=np.float32)
+    quantized = _quantize(values, np.int8, quantization)
+    np.testing.assert_array_equal(quantized, [-128, -127, 127, 127])
+
 
 if __name__ == '__main__':
   unittest.main()
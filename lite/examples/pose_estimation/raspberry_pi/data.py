@@ -14,7 +14,7 @@
 """Module contains the data types used in pose estimation."""
 
 import enum
-from typing import List, NamedTuple
+from typing import List, NamedTuple, Optional
 
 import numpy as np
 
@@ -64,6 +64,14 @@ class Person(NamedTuple):
   keypoints: List[KeyPoint]
   bounding_box: Rectangle
   score: float
+  # Scores of the keypoints as a numpy array with shape [17]. This is a view of
+  # the pose estimation model output the Person was created from, not a copy.
+  # Optional, as it can be derived from keypoints.
+  keypoint_scores: Optional[np.ndarray] = None
+  # Coordinates of the keypoints as an int32 numpy array with shape [17, 2].
+  # Each row represents a keypoint: [x, y]. Optional, as it can be derived from
+  # keypoints.
+  keypoint_coordinates: Optional[np.ndarray] = None
 
 
 def person_from_keypoints_with_scores(
@@ -90,13 +98,12 @@ def person_from_keypoints_with_scores(
   scores = keypoints_with_scores[:, 2]
 
   # Convert keypoints to the input image coordinate system.
+  keypoint_coordinates = (
+      keypoints_with_scores[:, 1::-1] *
+      np.array([image_width, image_height], dtype=np.float32)).astype(np.int32)
   keypoints = []
-  for i in range(scores.shape[0]):
-    keypoints.append(
-        KeyPoint(
-            BodyPart(i),
-            Point(int(kpts_x[i] * image_width), int(kpts_y[i] * image_height)),
-            scores[i]))
+  for i, (x, y) in enumerate(keypoint_coordinates.tolist()):
+    keypoints.append(KeyPoint(BodyPart(i), Point(x, y), scores[i]))
 
   # Calculate bounding box as SinglePose models don't return bounding box.
   start_point = Point(
@@ -110,7 +117,8 @@ def person_from_keypoints_with_scores(
       filter(lambda x: x > keypoint_score_threshold, scores))
   person_score = np.average(scores_above_threshold)
 
-  return Person(keypoints, bounding_box, person_score)
+  return Person(keypoints, bounding_box, person_score, scores,
+                keypoint_coordinates)
 
 
 class Category(NamedTuple):
@@ -0,0 +1,60 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit test of the pose estimation data types."""
+
+import unittest
+
+import data
+import numpy as np
+
+_IMAGE_HEIGHT = 480
+_IMAGE_WIDTH = 640
+
+
+class PersonFromKeypointsWithScoresTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    # Include keypoints slightly outside of the image, which the models can
+    # return for body parts near the image border.
+    self.keypoints_with_scores = np.stack(
+        [
+            np.linspace(-0.02, 1.02, 17),
+            np.linspace(1.03, -0.01, 17),
+            np.linspace(0.05, 0.95, 17)
+        ],
+        axis=-1).astype(np.float32)
+
+  def test_keypoint_arrays_match_keypoints(self):
+    person = data.person_from_keypoints_with_scores(self.keypoints_with_scores,
+                                                    _IMAGE_HEIGHT, _IMAGE_WIDTH)
+    self.assertEqual(person.keypoint_coordinates.shape, (17, 2))
+    self.assertEqual(person.keypoint_coordinates.dtype, np.int32)
+    for i, keypoint in enumerate(person.keypoints):
+      self.assertEqual(keypoint.body_part, data.BodyPart(i))
+      self.assertEqual(
+          tuple(person.keypoint_coordinates[i].tolist()), keypoint.coordinate)
+      self.assertEqual(person.keypoint_scores[i], keypoint.score)
+
+  def test_keypoint_coordinates_are_truncated_in_float32(self):
+    person = data.person_from_keypoints_with_scores(self.keypoints_with_scores,
+                                                    _IMAGE_HEIGHT, _IMAGE_WIDTH)
+    for i, keypoint in enumerate(person.keypoints):
+      y, x, _ = self.keypoints_with_scores[i]
+      self.assertEqual(keypoint.coordinate,
+                       (int(x * _IMAGE_WIDTH), int(y * _IMAGE_HEIGHT)))
+
+
+if __name__ == '__main__':
+  unittest.main()
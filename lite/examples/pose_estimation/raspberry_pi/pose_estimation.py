@@ -24,7 +24,7 @@ import utils
 
 
 def run(estimation_model, classification_model, label_file, camera_id, width,
-        height):
+        height, num_threads):
   """Continuously run inference on images acquired from the camera.
 
   Args:
@@ -37,6 +37,8 @@ def run(estimation_model, classification_model, label_file, camera_id, width,
     camera_id: The camera id to be passed to OpenCV.
     width: The width of the frame captured from the camera.
     height: The height of the frame captured from the camera.
+    num_threads: The number of CPU threads to run the pose classification
+      model.
   """
   if estimation_model in ['movenet_lightning', 'movenet_thunder']:
     pose_detector = Movenet(estimation_model)
@@ -65,7 +67,8 @@ def run(estimation_model, classification_model, label_file, camera_id, width,
 
   # Initialize the classification model
   if classification_model:
-    classifier = Classifier(classification_model, label_file)
+    classifier = Classifier(
+        classification_model, label_file, num_threads=num_threads)
     detection_results_to_show = min(max_detection_results,
                                     len(classifier.pose_class_names))
 
@@ -134,6 +137,11 @@ def main():
       default='movenet_lightning')
   parser.add_argument(
       '--classifier', help='Name of classification model.', required=False)
+  parser.add_argument(
+      '--num_threads',
+      help='Number of CPU threads to run the classification model.',
+      required=False,
+      default=2)
   parser.add_argument(
       '--label_file',
       help='Label file for classification.',
@@ -154,7 +162,7 @@ def main():
   args = parser.parse_args()
 
   run(args.model, args.classifier, args.label_file, int(args.cameraId),
-      args.frameWidth, args.frameHeight)
+      args.frameWidth, args.frameHeight, int(args.num_threads))
 
 
 if __name__ == '__main__':
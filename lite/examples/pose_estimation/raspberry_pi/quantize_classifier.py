@@ -0,0 +1,123 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Script to convert a pose classification model to a quantized TFLite model.
+
+This script requires the full TensorFlow package, so it's meant to be run
+offline on a computer rather than on the Raspberry Pi.
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+_NUM_KEYPOINT_VALUES = 51
+_QUANTIZATION_FLOAT16 = 'float16'
+_QUANTIZATION_INT8 = 'int8'
+
+
+def _load_keypoints(csv_path):
+  """Load keypoints used as representative dataset from a CSV file.
+
+  Args:
+    csv_path: Path to a CSV file. Each row contains the [y, x, score] values of
+      the 17 COCO keypoints as its first 51 numeric columns. Other columns,
+      such as file names or class names, are ignored.
+
+  Returns:
+    A float32 numpy array with shape [num_rows, 51].
+  """
+  dataframe = pd.read_csv(csv_path).select_dtypes(include='number')
+  keypoints = dataframe.iloc[:, :_NUM_KEYPOINT_VALUES]
+  if keypoints.shape[1] != _NUM_KEYPOINT_VALUES:
+    raise ValueError('%s has %d numeric columns, but %d keypoint values are '
+                     'required.' %
+                     (csv_path, keypoints.shape[1], _NUM_KEYPOINT_VALUES))
+  return keypoints.to_numpy(dtype=np.float32)
+
+
+def _quantize_model(model, quantization, representative_keypoints=None):
+  """Convert a Keras pose classification model to a quantized TFLite model.
+
+  Args:
+    model: The Keras pose classification model.
+    quantization: The quantization type. Either `float16` or `int8`.
+    representative_keypoints: A float32 numpy array with shape [N, 51]. Only
+      required for `int8` quantization.
+
+  Returns:
+    The TFLite model as bytes.
+  """
+  converter = tf.lite.TFLiteConverter.from_keras_model(model)
+  converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+  if quantization == _QUANTIZATION_FLOAT16:
+    converter.target_spec.supported_types = [tf.float16]
+  elif quantization == _QUANTIZATION_INT8:
+    if representative_keypoints is None:
+      raise ValueError('A representative dataset is required for int8 '
+                       'quantization.')
+
+    def representative_dataset():
+      for keypoints in representative_keypoints:
+        yield [np.expand_dims(keypoints, axis=0)]
+
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+  else:
+    raise ValueError('Unsupported quantization type: %s' % quantization)
+
+  return converter.convert()
+
+
+def main():
+  parser = argparse.ArgumentParser(
+      formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument(
+      '--keras_model',
+      help='Path to the Keras pose classification model (SavedModel or .h5).',
+      required=True)
+  parser.add_argument(
+      '--output',
+      help='Path of the output TFLite model.',
+      required=False,
+      default='classifier_quantized.tflite')
+  parser.add_argument(
+      '--quantization',
+      help='Quantization type.',
+      required=False,
+      choices=[_QUANTIZATION_FLOAT16, _QUANTIZATION_INT8],
+      default=_QUANTIZATION_FLOAT16)
+  parser.add_argument(
+      '--representative_csv',
+      help='CSV file of keypoints used to calibrate int8 quantization.',
+      required=False)
+  args = parser.parse_args()
+
+  model = tf.keras.models.load_model(args.keras_model)
+  representative_keypoints = None
+  if args.representative_csv:
+    representative_keypoints = _load_keypoints(args.representative_csv)
+
+  tflite_model = _quantize_model(model, args.quantization,
+                                 representative_keypoints)
+  with open(args.output, 'wb') as f:
+    f.write(tflite_model)
+  print('Created quantized TFLite model: %s' % args.output)
+
+
+if __name__ == '__main__':
+  main()
@@ -13,7 +13,6 @@
 # limitations under the License.
 """Utility functions to display the pose detection results."""
 
-import math
 from typing import List, Tuple
 
 import cv2
@@ -64,6 +63,29 @@ KEYPOINT_EDGE_INDS_TO_COLOR = {
     (14, 16): (255, 255, 0)
 }
 
+# Keypoint indices of the edges above as an array, so that the edges to be
+# drawn can be selected without iterating over them in Python, and the colors
+# of the edges in the same order.
+_EDGE_IDX = np.array(list(KEYPOINT_EDGE_INDS_TO_COLOR.keys()), dtype=np.int32)
+_EDGE_COLORS = list(KEYPOINT_EDGE_INDS_TO_COLOR.values())
+
+# Keypoint indices of the edges grouped by color, so that all edges of a color
+# can be drawn with a single cv2.polylines call.
+_EDGE_IDX_BY_COLOR = {
+    color: np.array([
+        edge_pair for edge_pair, edge_color in
+        KEYPOINT_EDGE_INDS_TO_COLOR.items() if edge_color == color
+    ],
+                    dtype=np.int32)
+    for color in dict.fromkeys(_EDGE_COLORS)
+}
+
+# Output image of keep_aspect_ratio_resizer, keyed by its shape and type, so
+# that it's reused across frames instead of being allocated on every call. Only
+# the most recent output image is kept, as frames from a camera share the same
+# size.
+_RESIZER_OUTPUT_CACHE = {}
+
 
 def draw_landmarks_edges(image,
                          keypoint_locs,
@@ -71,14 +93,23 @@ def draw_landmarks_edges(image,
                          edge_colors,
                          keypoint_color=(0, 255, 0)):
   """Draw landmarks and edges on the input image and return it."""
-  for landmark in keypoint_locs:
-    landmark_x = min(landmark[0], image.shape[1] - 1)
-    landmark_y = min(landmark[1], image.shape[0] - 1)
-    cv2.circle(image, (int(landmark_x), int(landmark_y)), 2, keypoint_color, 4)
-
-  for idx, edge in enumerate(keypoint_edges):
-    cv2.line(image, (int(edge[0][0]), int(edge[0][1])),
-             (int(edge[1][0]), int(edge[1][1])), edge_colors[idx], 2)
+  # Clamp all landmarks to the image border and convert them to integer pixel
+  # coordinates at once, so that the loop below only calls OpenCV.
+  landmarks = np.minimum(keypoint_locs,
+                         [image.shape[1] - 1, image.shape[0] - 1])
+  for landmark_x, landmark_y in landmarks.astype(np.int32).tolist():
+    cv2.circle(image, (landmark_x, landmark_y), 2, keypoint_color, 4)
+
+  # Draw the edges with one cv2.polylines call per color. Each edge is an open
+  # polyline of 2 points.
+  if len(keypoint_edges):
+    edges = np.asarray(keypoint_edges).astype(np.int32)
+    colors, color_ids = np.unique(
+        np.asarray(edge_colors), axis=0, return_inverse=True)
+    color_ids = color_ids.reshape(-1)
+    for color_id, color in enumerate(colors.tolist()):
+      cv2.polylines(image, list(edges[color_ids == color_id]), False,
+                    tuple(color), 2)
 
   return image
 
@@ -103,38 +134,20 @@ def keypoints_and_edges_for_display(keypoints_with_scores,
       * the coordinates of all skeleton edges of all detected entities;
       * the colors in which the edges should be plotted.
   """
-  keypoints_all = []
-  keypoint_edges_all = []
-  edge_colors = []
-  kpts_x = keypoints_with_scores[:, 1]
-  kpts_y = keypoints_with_scores[:, 0]
   kpts_scores = keypoints_with_scores[:, 2]
-  kpts_absolute_xy = np.stack(
-      [width * np.array(kpts_x), height * np.array(kpts_y)], axis=-1)
-  kpts_above_thresh_absolute = kpts_absolute_xy[
-      kpts_scores > keypoint_threshold]
-  keypoints_all.append(kpts_above_thresh_absolute)
-
-  for edge_pair, color in KEYPOINT_EDGE_INDS_TO_COLOR.items():
-    if (kpts_scores[edge_pair[0]] > keypoint_threshold and
-        kpts_scores[edge_pair[1]] > keypoint_threshold):
-      x_start = kpts_absolute_xy[edge_pair[0], 0]
-      y_start = kpts_absolute_xy[edge_pair[0], 1]
-      x_end = kpts_absolute_xy[edge_pair[1], 0]
-      y_end = kpts_absolute_xy[edge_pair[1], 1]
-      line_seg = np.array([[x_start, y_start], [x_end, y_end]])
-      keypoint_edges_all.append(line_seg)
-      edge_colors.append(color)
-  if keypoints_all:
-    keypoints_xy = np.concatenate(keypoints_all, axis=0)
-  else:
-    num_instances, _ = keypoints_with_scores.shape
-    keypoints_xy = np.zeros((0, num_instances, 2))
-
-  if keypoint_edges_all:
-    edges_xy = np.stack(keypoint_edges_all, axis=0)
-  else:
-    edges_xy = np.zeros((0, 2, 2))
+  # Reorder each keypoint from [y, x] to [x, y] using a view, then scale both
+  # coordinates to the image size with a single broadcast multiplication.
+  kpts_absolute_xy = keypoints_with_scores[:, 1::-1] * np.array(
+      [width, height], dtype=np.float32)
+  kpts_above_thresh = kpts_scores > keypoint_threshold
+  keypoints_xy = kpts_absolute_xy[kpts_above_thresh]
+
+  # Select the edges whose both keypoints are above the threshold, and gather
+  # their coordinates into an array of shape [num_edges, 2, 2].
+  edge_mask = (
+      kpts_above_thresh[_EDGE_IDX[:, 0]] & kpts_above_thresh[_EDGE_IDX[:, 1]])
+  edges_xy = kpts_absolute_xy[_EDGE_IDX[edge_mask]]
+  edge_colors = [_EDGE_COLORS[idx] for idx in np.flatnonzero(edge_mask)]
 
   return keypoints_xy, edges_xy, edge_colors
 
@@ -162,20 +175,27 @@ def visualize(
     if person.score < instance_threshold:
       continue
 
-    keypoints = person.keypoints
+    scores = person.keypoint_scores
+    coordinates = person.keypoint_coordinates
+    if scores is None or coordinates is None:
+      scores = np.array([keypoint.score for keypoint in person.keypoints])
+      coordinates = np.array(
+          [keypoint.coordinate for keypoint in person.keypoints],
+          dtype=np.int32)
     bounding_box = person.bounding_box
 
     # Draw all the landmarks
-    for i in range(len(keypoints)):
-      if keypoints[i].score >= keypoint_threshold:
-        cv2.circle(image, keypoints[i].coordinate, 2, keypoint_color, 4)
-
-    # Draw all the edges
-    for edge_pair, color in KEYPOINT_EDGE_INDS_TO_COLOR.items():
-      if (keypoints[edge_pair[0]].score > keypoint_threshold and
-          keypoints[edge_pair[1]].score > keypoint_threshold):
-        cv2.line(image, keypoints[edge_pair[0]].coordinate,
-                 keypoints[edge_pair[1]].coordinate, color, 2)
+    for landmark in coordinates[scores >= keypoint_threshold].tolist():
+      cv2.circle(image, tuple(landmark), 2, keypoint_color, 4)
+
+    # Draw all the edges, with one cv2.polylines call per color
+    kpts_above_thresh = scores > keypoint_threshold
+    for color, edge_idx in _EDGE_IDX_BY_COLOR.items():
+      edge_mask = (
+          kpts_above_thresh[edge_idx[:, 0]] & kpts_above_thresh[edge_idx[:, 1]])
+      if edge_mask.any():
+        cv2.polylines(image, list(coordinates[edge_idx[edge_mask]]), False,
+                      color, 2)
 
     # Draw bounding_box with multipose
     if bounding_box is not None:
@@ -202,28 +222,43 @@ def keep_aspect_ratio_resizer(
     target_size: Desired size that the image should be resize to.
 
   Returns:
-    image: The resized image.
+    image: The resized image. Note that the returned array is reused by
+      subsequent calls with the same output size, so copy it if it needs to be
+      kept. For the same reason, the function must not be called concurrently
+      from multiple threads.
     (target_height, target_width): The actual image size after resize.
 
   """
   height, width, _ = image.shape
-  if height > width:
-    scale = float(target_size / height)
-    target_height = target_size
-    scaled_width = math.ceil(width * scale)
-    image = cv2.resize(image, (scaled_width, target_height))
-    target_width = int(math.ceil(scaled_width / 32) * 32)
+  long_side = max(height, width)
+  # Scale both sides with integer ceil division, so the longer side becomes
+  # exactly target_size.
+  scaled_height = -(-height * target_size // long_side)
+  scaled_width = -(-width * target_size // long_side)
+  # INTER_AREA is both faster and more accurate than the default INTER_LINEAR
+  # when shrinking the image.
+  if target_size < long_side:
+    interpolation = cv2.INTER_AREA
   else:
-    scale = float(target_size / width)
-    target_width = target_size
-    scaled_height = math.ceil(height * scale)
-    image = cv2.resize(image, (target_width, scaled_height))
-    target_height = int(math.ceil(scaled_height / 32) * 32)
-
-  padding_top, padding_left = 0, 0
-  padding_bottom = target_height - image.shape[0]
-  padding_right = target_width - image.shape[1]
-  # add padding to image
-  image = cv2.copyMakeBorder(image, padding_top, padding_bottom, padding_left,
-                             padding_right, cv2.BORDER_CONSTANT)
-  return image, (target_height, target_width)
+    interpolation = cv2.INTER_LINEAR
+
+  # Round both sides up to a multiple of 32.
+  target_height = scaled_height + (-scaled_height & 31)
+  target_width = scaled_width + (-scaled_width & 31)
+
+  # Resize the image directly into the top left corner of the cached output
+  # image, and clear the padding at the bottom and right.
+  cache_key = (target_height, target_width, image.shape[2], image.dtype)
+  output_image = _RESIZER_OUTPUT_CACHE.get(cache_key)
+  if output_image is None:
+    output_image = np.empty((target_height, target_width, image.shape[2]),
+                            dtype=image.dtype)
+    _RESIZER_OUTPUT_CACHE.clear()
+    _RESIZER_OUTPUT_CACHE[cache_key] = output_image
+  cv2.resize(
+      image, (scaled_width, scaled_height),
+      dst=output_image[:scaled_height, :scaled_width],
+      interpolation=interpolation)
+  output_image[scaled_height:] = 0
+  output_image[:scaled_height, scaled_width:] = 0
+  return output_image, (target_height, target_width)
@@ -0,0 +1,164 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit test of the pose estimation utility functions."""
+
+import unittest
+
+import data
+import numpy as np
+import utils
+
+_IMAGE_HEIGHT = 100
+_IMAGE_WIDTH = 200
+
+
+def _keypoints_with_scores(visible_keypoints):
+  """Create [17, 3] keypoints where only the given keypoints have high score."""
+  keypoints_with_scores = np.zeros((17, 3), dtype=np.float32)
+  keypoints_with_scores[:, 0] = np.linspace(0.1, 0.9, 17)
+  keypoints_with_scores[:, 1] = np.linspace(0.9, 0.1, 17)
+  keypoints_with_scores[visible_keypoints, 2] = 0.9
+  return keypoints_with_scores
+
+
+class KeypointsAndEdgesForDisplayTest(unittest.TestCase):
+
+  def test_no_keypoints_above_threshold(self):
+    keypoints_with_scores = _keypoints_with_scores([])
+    (keypoints_xy, edges_xy,
+     edge_colors) = utils.keypoints_and_edges_for_display(
+         keypoints_with_scores, _IMAGE_HEIGHT, _IMAGE_WIDTH)
+    self.assertEqual(keypoints_xy.shape, (0, 2))
+    self.assertEqual(edges_xy.shape, (0, 2, 2))
+    self.assertEqual(edge_colors, [])
+
+  def test_edges_and_colors_are_aligned(self):
+    visible_keypoints = [0, 1, 2, 5]
+    keypoints_with_scores = _keypoints_with_scores(visible_keypoints)
+    (keypoints_xy, edges_xy,
+     edge_colors) = utils.keypoints_and_edges_for_display(
+         keypoints_with_scores, _IMAGE_HEIGHT, _IMAGE_WIDTH)
+
+    expected_xy = keypoints_with_scores[:, [1, 0]] * [_IMAGE_WIDTH,
+                                                       _IMAGE_HEIGHT]
+    np.testing.assert_allclose(keypoints_xy, expected_xy[visible_keypoints])
+
+    expected_edges = [(0, 1), (0, 2), (0, 5)]
+    self.assertEqual(edges_xy.shape, (len(expected_edges), 2, 2))
+    self.assertEqual(
+        edge_colors,
+        [utils.KEYPOINT_EDGE_INDS_TO_COLOR[edge] for edge in expected_edges])
+    for edge_xy, edge in zip(edges_xy, expected_edges):
+      np.testing.assert_allclose(edge_xy, expected_xy[list(edge)])
+
+
+class DrawLandmarksEdgesTest(unittest.TestCase):
+
+  def test_draw_landmarks_without_edges(self):
+    """Test drawing landmarks only, as done by visualizer.py."""
+    image = np.zeros((_IMAGE_HEIGHT, _IMAGE_WIDTH, 3), dtype=np.uint8)
+    keypoint_color = (255, 0, 0)
+    # The second landmark is outside of the image and should be clamped to the
+    # bottom right corner.
+    keypoint_locs = np.array([[50.7, 20.2], [500, 300]])
+    image = utils.draw_landmarks_edges(image, keypoint_locs, [], None,
+                                       keypoint_color)
+
+    np.testing.assert_array_equal(image[20, 50], keypoint_color)
+    np.testing.assert_array_equal(image[_IMAGE_HEIGHT - 1, _IMAGE_WIDTH - 1],
+                                  keypoint_color)
+
+
+class VisualizeTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    # Include keypoints slightly outside of the image.
+    keypoints_with_scores = _keypoints_with_scores(range(17))
+    keypoints_with_scores[0, :2] = [-0.05, 1.05]
+    keypoints_with_scores[16, :2] = [1.05, -0.05]
+    self.person = data.person_from_keypoints_with_scores(
+        keypoints_with_scores, _IMAGE_HEIGHT, _IMAGE_WIDTH)
+
+  def test_visualize(self):
+    image = np.zeros((_IMAGE_HEIGHT, _IMAGE_WIDTH, 3), dtype=np.uint8)
+    image = utils.visualize(image, [self.person])
+    self.assertEqual(image.shape, (_IMAGE_HEIGHT, _IMAGE_WIDTH, 3))
+    self.assertTrue(np.any(image), 'Nothing was drawn.')
+
+  def test_visualize_person_without_keypoint_arrays(self):
+    """Test if a Person created from only the keypoints is drawn the same."""
+    person = data.Person(self.person.keypoints, self.person.bounding_box,
+                         self.person.score)
+    image = np.zeros((_IMAGE_HEIGHT, _IMAGE_WIDTH, 3), dtype=np.uint8)
+    expected_image = utils.visualize(image.copy(), [self.person])
+    np.testing.assert_array_equal(
+        utils.visualize(image, [person]), expected_image)
+
+
+class KeepAspectRatioResizerTest(unittest.TestCase):
+
+  def _resize_and_assert(self, image_shape, target_size, expected_scaled_size,
+                         expected_target_size):
+    """Resize a white image and assert the output size and zero padding."""
+    image = np.full(image_shape, 255, dtype=np.uint8)
+    output_image, target_shape = utils.keep_aspect_ratio_resizer(
+        image, target_size)
+
+    scaled_height, scaled_width = expected_scaled_size
+    self.assertEqual(target_shape, expected_target_size)
+    self.assertEqual(output_image.shape, expected_target_size + (3,))
+    self.assertTrue(
+        np.all(output_image[:scaled_height, :scaled_width] == 255),
+        'Resized image is not at the top left corner of the output.')
+    self.assertTrue(
+        np.all(output_image[scaled_height:] == 0),
+        'Bottom padding is not zero.')
+    self.assertTrue(
+        np.all(output_image[:, scaled_width:] == 0),
+        'Right padding is not zero.')
+
+  def test_landscape(self):
+    self._resize_and_assert((480, 640, 3), 256, (192, 256), (192, 256))
+
+  def test_portrait(self):
+    self._resize_and_assert((640, 480, 3), 256, (256, 192), (256, 192))
+
+  def test_square(self):
+    self._resize_and_assert((300, 300, 3), 256, (256, 256), (256, 256))
+
+  def test_target_size_not_multiple_of_32(self):
+    self._resize_and_assert((480, 640, 3), 250, (188, 250), (192, 256))
+
+  def test_output_image_is_reused(self):
+    """Test if calls with the same output size return the same array."""
+    image_1 = np.full((480, 640, 3), 255, dtype=np.uint8)
+    image_2 = np.zeros((480, 640, 3), dtype=np.uint8)
+    output_image_1, _ = utils.keep_aspect_ratio_resizer(image_1, 256)
+    output_image_2, _ = utils.keep_aspect_ratio_resizer(image_2, 256)
+    self.assertIs(output_image_1, output_image_2)
+    self.assertTrue(np.all(output_image_1 == 0))
+
+  def test_only_last_output_image_is_kept(self):
+    """Test if resizing to a new size releases the previous output image."""
+    image = np.zeros((480, 640, 3), dtype=np.uint8)
+    output_image_1, _ = utils.keep_aspect_ratio_resizer(image, 256)
+    utils.keep_aspect_ratio_resizer(image, 320)
+    output_image_2, _ = utils.keep_aspect_ratio_resizer(image, 256)
+    self.assertIsNot(output_image_1, output_image_2)
+    self.assertEqual(len(utils._RESIZER_OUTPUT_CACHE), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()